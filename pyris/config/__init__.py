@@ -1,4 +1,4 @@
 __all__ = [ 'default_config', 'create_cfg_file', 'get_cfg', 'set_cfg' ]
 
-from config import default_config, create_cfg_file, get_cfg, set_cfg
+from .config import default_config, create_cfg_file, get_cfg, set_cfg
 
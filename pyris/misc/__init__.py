@@ -1,3 +1,3 @@
 __all__ = [ 'GeoReference', 'NaNs', 'LoadLandsatData', 'Line2D', 'MaskClean' ]
 
-from misc import *
+from .misc import *
@@ -1,7 +1,7 @@
-from morphology import CleanIslands, RemoveSmallObjects, Skeletonize
-from pruner import Pruner, Pruning
-from segmentation import Thresholding, SegmentationIndex
-from bars import Unwrapper, BarFinder, TemporalBars, FreeTemporalBars
+from .morphology import CleanIslands, RemoveSmallObjects, Skeletonize
+from .pruner import Pruner, Pruning
+from .segmentation import Thresholding, SegmentationIndex
+from .bars import Unwrapper, BarFinder, TemporalBars, FreeTemporalBars
 
 __all__ = [
     'CleanIslands', 'RemoveSmallObjects', 'Skeletonize',
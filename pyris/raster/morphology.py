@@ -1,4 +1,3 @@
-from __future__ import division
 import numpy as np
 from skimage import morphology as mm
 
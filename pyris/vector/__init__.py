@@ -1,9 +1,9 @@
 import numpy as np
 from scipy import interpolate
 from ..misc import NaNs, Intersection
-from axis import AxisReader, ReadAxisLine
-from interpolation import InterpPCS, CurvaturePCS, WidthPCS
-from migration import AxisMigration
+from .axis import AxisReader, ReadAxisLine
+from .interpolation import InterpPCS, CurvaturePCS, WidthPCS
+from .migration import AxisMigration
 
 
 __all__ = [ 
@@ -7,13 +7,16 @@
 # Description: Migration vectors and bend separation
 # ==================================================
 
-from __future__ import division
+from collections import namedtuple
 import numpy as np
 from scipy import interpolate
-from ..misc import NaNs, Intersection
+from ..misc import NaNs
 from .interpolation import InterpPCS, CurvaturePCS
 import matplotlib.pyplot as plt
 
+# Struct-of-arrays planform record
+Planform = namedtuple( 'Planform', [ 'x', 'y', 's', 'c', 't', 'r' ] )
+
 
 class AxisMigration( object ):
 
@@ -41,38 +44,59 @@ class AxisMigration( object ):
 
     Css = []
     method = 'curvature' # distance must be taken away
+    use_spline = False # Resample bends through InterpPCS instead of linear arc-length interpolation
     
     def __init__( self, Xseries, Yseries ):
         '''
         Get Subsequent Channel Planforms
         '''
-        self.data = []
+        # Planform quantities are stored as struct-of-arrays: one list of
+        # contiguous arrays per quantity, bundled on access by self.data(i)
+        self.X, self.Y, self.S, self.C, self.T, self.R = [], [], [], [], [], []
+        Xseries = [ np.asarray( x ) for x in Xseries ]
+        Yseries = [ np.asarray( y ) for y in Yseries ]
+        if len( Xseries ) > 1 and len( set( x.size for x in Xseries ) ) == 1:
+            # Equal-length planforms: stack the series and amortize the NumPy
+            # calls over all the planforms at once
+            X, Y = np.stack( Xseries ), np.stack( Yseries )
+            dX = np.diff( X, axis=1, prepend=X[:,:1] )
+            dY = np.diff( Y, axis=1, prepend=Y[:,:1] )
+            S = np.cumsum( np.hypot( dX, dY ), axis=1 )
+            rTheta = np.arctan2( dY, dX )
+            Theta = np.unwrap( rTheta, axis=1 ) # Set theta continuous
+            for i, (x, y) in enumerate( zip( Xseries, Yseries ) ):
+                self.X.append( x ), self.Y.append( y ), self.S.append( S[i] )
+                self.C.append( -np.gradient( Theta[i], S[i] ) )
+                self.T.append( Theta[i] ), self.R.append( rTheta[i] )
+            return None
         for x, y in zip( Xseries, Yseries ):
-            x, y = np.asarray(x), np.asarray(y)
             dx = np.ediff1d( x, to_begin=0 )
             dy = np.ediff1d( y, to_begin=0 )
-            ds = np.sqrt( dx**2 + dy**2 )
+            ds = np.hypot( dx, dy )
             s = np.cumsum( ds )
             theta = np.arctan2( dy, dx )
             rtheta = theta.copy()
-            for i in xrange( 1, theta.size ): # Set theta continuous
-                if (theta[i]-theta[i-1])/np.pi > +1.9: theta[i] -=2*np.pi
-                if (theta[i]-theta[i-1])/np.pi < -1.9: theta[i] +=2*np.pi
-            c = -np.gradient( theta ) / np.gradient( s )
-            self.data.append( { 'x': x, 'y': y, 's': s, 'c':c, 't':theta, 'r':rtheta } )
+            theta = np.unwrap( theta ) # Set theta continuous
+            c = -np.gradient( theta, s )
+            self.X.append( x ), self.Y.append( y ), self.S.append( s )
+            self.C.append( c ), self.T.append( theta ), self.R.append( rtheta )
         return None
 
+    def data( self, i ):
+        '''Bundle the i-th planform arrays into a Planform record'''
+        return Planform( self.X[i], self.Y[i], self.S[i], self.C[i], self.T[i], self.R[i] )
+
     def IterData( self ):
         '''Planform data iterator'''
-        for i, d in enumerate( self.data ): yield i, d
+        for i in range( len( self.X ) ): yield i, self.data( i )
 
     def IterData2( self ):
         '''Planform data pair iterator'''
-        for i, (d1, d2) in enumerate( zip( self.data[:-1], self.data[1:]) ): yield i, (d1, d2)
+        for i in range( len( self.X )-1 ): yield i, ( self.data( i ), self.data( i+1 ) )
 
     def RevIterData2( self ):
         '''Reverse planform data pair iterator'''
-        for i, (d1, d2) in enumerate( zip( self.data[:-1][::-1], self.data[1:][::-1] ) ): yield ( len(self.data)-2-i ), (d2, d1)
+        for i in range( len( self.X )-2, -1, -1 ): yield i, ( self.data( i+1 ), self.data( i ) )
 
     def Iterbends( self, Idx ):
         '''Bend Iterator'''
@@ -86,9 +110,9 @@ class AxisMigration( object ):
         '''Perform ICWT Filtering on all the Data'''
         for i, d in self.IterData():
             if i==0:
-                self.Css.append( self.FilterCs( d['c'], d['s'], d['x'], d['y'], pfreq=int(2.5*pfreq) ) )
+                self.Css.append( self.FilterCs( d.c, d.s, d.x, d.y, pfreq=int(2.5*pfreq) ) )
             else:
-                self.Css.append( self.FilterCs( d['c'], d['s'], d['x'], d['y'], pfreq=int(pfreq) ) )
+                self.Css.append( self.FilterCs( d.c, d.s, d.x, d.y, pfreq=int(pfreq) ) )
         return None
 
     def FilterCs( self, s, Cs, x, y, pfreq ):
@@ -109,11 +133,13 @@ class AxisMigration( object ):
     def DistanceInflections( self, data, prev_data, prev_I ):
         '''Compute Inflection points by moving orthogonally from previous inflection points'''
         I = NaNs( prev_I.size )
+        L = 10*np.gradient( data.s ).mean() # Search length, fixed for the whole planform pair
         for j, prev_i in enumerate(prev_I):
             if np.isnan( prev_i ): continue
-            i = self.FindOrthogonalPoint( data, prev_data, prev_i )
+            i = self.FindOrthogonalPoint( data, prev_data, prev_i, L=L )
+            if i is None: continue
             if j > 0 and i <= I[j-1]: continue
-            I[j] = i if i is not None else np.nan
+            I[j] = i
         return np.asarray( I )            
 
     def GetAllInflections( self ):
@@ -126,7 +152,7 @@ class AxisMigration( object ):
             for i, d in self.IterData():
                 if i == 0: self.I.append( self.GetInflections( self.Css[i] ) )
                 else:
-                    self.I.append( self.DistanceInflections( d, self.data[i-1], self.I[i-1] ) )
+                    self.I.append( self.DistanceInflections( d, self.data( i-1 ), self.I[i-1] ) )
         return None
 
     def CorrelateInflections( self, *args, **kwargs ):
@@ -136,8 +162,8 @@ class AxisMigration( object ):
         self.CI12 = [] # Points to which the First Planform Points Converge to the Second Planform
 
         if self.method == 'distance':            
-            self.CI1 = [ [] for _ in xrange( len( self.data ) ) ]
-            self.CI12 = [ [] for _ in xrange( len( self.data ) ) ]
+            self.CI1 = [ [] for _ in range( len( self.X ) ) ]
+            self.CI12 = [ [] for _ in range( len( self.X ) ) ]
             for i, (d1, d2) in self.IterData2():
                 mask = np.isfinite( self.I[i+1] )
                 self.CI1[i+1] = self.I[i+1][ mask ].astype( int )
@@ -152,8 +178,8 @@ class AxisMigration( object ):
             for i, (d1, d2) in self.IterData2():
                 C2 = self.I[i+1]
                 C12 = np.zeros_like( C1, dtype=int )
-                x1, y1, R1, T1 = d1['x'], d1['y'], d1['r'], d1['t']
-                x2, y2, R2, T2 = d2['x'], d2['y'], d2['r'], d2['t']
+                x1, y1, R1, T1 = d1.x, d1.y, d1.r, d1.t
+                x2, y2, R2, T2 = d2.x, d2.y, d2.r, d2.t
 
                 for ipoint, Ipoint in enumerate( C1 ):
                     xi1, yi1, ti1 = x1[Ipoint], y1[Ipoint], R1[Ipoint]
@@ -166,21 +192,24 @@ class AxisMigration( object ):
                     try:
                         C12[ipoint] = C2[ np.nanargmin( np.sqrt( (xC2-xi1)**2 + (yC2-yi1)**2 ) ) ]
                     except ValueError:
-                        raise ValueError, 'not able to compute inflection correlation for planform n. %d. Please check your axis' % (i+2)
+                        raise ValueError('not able to compute inflection correlation for planform n. %d. Please check your axis' % (i+2))
                     
                 # There are some duplicated points - we need to get rid of them
                 unique, counts = np.unique(C12, return_counts=True)
                 duplic = unique[ counts>1 ]
-                cduplic = counts[ counts > 1 ]                
-                for idup, (dup, cdup) in enumerate( zip( duplic, cduplic ) ):
-                    idxs = np.where( C12==dup )[0]
-                    idx = np.argmin( np.sqrt( (x2[dup]-x1[C1][idxs])**2 + (y2[dup]-y1[C1][idxs])**2 ) )                    
-                    idxs = np.delete( idxs, idx )
-                    C1 = np.delete( C1, idxs )
-                    C12 = np.delete( C12, idxs )
+                if duplic.size > 0:
+                    # Keep the closest point for each duplicate - one mask, no np.delete reallocations
+                    dist_all = np.hypot( x2[C12]-x1[C1], y2[C12]-y1[C1] )
+                    keep = np.ones( C12.size, dtype=bool )
+                    for dup in duplic:
+                        idxs = np.where( C12==dup )[0]
+                        keep[ idxs ] = False
+                        keep[ idxs[ dist_all[idxs].argmin() ] ] = True
+                    C1 = C1[ keep ]
+                    C12 = C12[ keep ]
                     
                 while np.any(C12[:-1]>C12[1:]):
-                    for j in xrange( 1, C1.size ):
+                    for j in range( 1, C1.size ):
                         l, r = j-1, j
                         cl, cr = C12[l], C12[r]
                         if cr < cl:
@@ -199,13 +228,19 @@ class AxisMigration( object ):
     def BendUpstreamDownstream( self, I, Cs ):
         '''Bend Upstream-Downstream Indexes'''
         BUD = NaNs( Cs.size )
-        for i, (il,ir) in self.Iterbends( I ):
-            iapex = il + np.abs( Cs[ il:ir ] ).argmax()
-            BUD[ il ] = 2 # Inflection Point
-            BUD[ ir ] = 2 # Inflection Point
-            BUD[ iapex ] = 0 # Bend Apex
-            BUD[ il+1:iapex ] = -1  # Bend Upstream
-            BUD[ iapex+1:ir ] = +1 # Bend Downstream
+        I = np.asarray( I, dtype=int )
+        if I.size < 2: return BUD
+        absC = np.abs( Cs )
+        # Per-bend apex: first point of each bend attaining the bend maximum of |Cs|
+        maxs = np.maximum.reduceat( absC, I )[ :I.size-1 ]
+        bend_id = np.repeat( np.arange( I.size-1 ), np.diff( I ) ) # Bend label of each point
+        pts = np.arange( I[0], I[-1] )
+        is_max = absC[ I[0]:I[-1] ] == maxs[ bend_id ]
+        first = np.unique( bend_id[ is_max ], return_index=True )[1]
+        iapex = pts[ is_max ][ first ]
+        BUD[ pts ] = np.where( pts < iapex[ bend_id ], -1, +1 ) # Bend Upstream/Downstream
+        BUD[ I ] = 2 # Inflection Points
+        BUD[ iapex ] = 0 # Bend Apexes
         return BUD
 
     def AllBUDs( self ):
@@ -234,7 +269,7 @@ class AxisMigration( object ):
         '''Apply Bend Labels to Each Planform'''
         self.BI = []
         for i, d in self.IterData():
-            self.BI.append( self.LabelBends( d['s'].size, self.CI1[i] ) )
+            self.BI.append( self.LabelBends( d.s.size, self.CI1[i] ) )
         return None
 
     def CorrelateBends( self ):
@@ -248,16 +283,14 @@ class AxisMigration( object ):
             I1 = self.CI1[di]
             I2 = self.CI1[di+1]
             I12 = self.CI12[di]
-            x1, y1, c1 = d1['x'], d1['y'], d1['c']
-            x2, y2, c2 = d2['x'], d2['y'], d2['c']
+            x1, y1, c1 = d1.x, d1.y, d1.c
+            x2, y2, c2 = d2.x, d2.y, d2.c
 
             # X il momento tengo la correlazione tra gli inflections
             for i, (i1l, i1r, i2l, i2r) in self.Iterbends2( I1, I12 ):
-                vals, cnts = np.unique( B2[i2l:i2r], return_counts=True )
-                if len( vals ) == 0:
-                    B12[i1l:i1r] = -1
-                else:
-                    B12[i1l:i1r] = vals[ cnts.argmax() ]
+                seg = B2[i2l:i2r]
+                # Shift by one so the -1 unlabelled points take part in the vote as before
+                B12[i1l:i1r] = np.bincount( seg+1 ).argmax() - 1 if seg.size > 0 else -1
 
             self.B12.append( B12 )
         self.B12.append( -np.ones( x2.size ) ) # Add a Convenience -1 Array for the Last Planform
@@ -265,36 +298,47 @@ class AxisMigration( object ):
 
     def FindOrthogonalPoint( self, data1, data2, i2, L=None ):
         '''Find the orthogonal point to second line on the first one'''
-        [ x1, y1, s1 ] = data1['x'], data1['y'], data1['s']
-        [ x2, y2, s2 ] = data2['x'], data2['y'], data2['s']
+        [ x1, y1, s1 ] = data1.x, data1.y, data1.s
+        [ x2, y2, s2 ] = data2.x, data2.y, data2.s
         if L is None: L = 10*np.gradient( s1 ).mean()
         a0 = np.arctan2( ( y2[i2+1] - y2[i2-1] ), ( x2[i2+1] - x2[i2-1] ) )
         a = a0 - np.pi/2 # Local Perpendicular Angle
-        P = np.array( [ x2[i2], y2[i2] ] )
-        R = np.array( [ np.cos(a), np.sin(a) ] ) * L
-        hits = []
-        for i in xrange( 1, x1.size ):
-            Q = np.array( [ x1[i-1], y1[i-1] ] )
-            S = np.array( [ x1[i], y1[i] ] ) - Q
-            # Bound angle
-            a1 = np.arctan2( (y1[i]-y1[i-1]), (x1[i]-x1[i-1]) )
-            if ( a0 > +np.pi/2 and a1 < -np.pi/2 ): a1 += 2*np.pi
-            if ( a0 < -np.pi/2 and a1 > +np.pi/2 ): a1 -= 2*np.pi
-            if a1 > a0+np.pi/4 or a1 < a0-np.pi/4: continue
-
-            segments_intersect, (xi, yi) = Intersection( P, Q, R, S )
-            if segments_intersect: hits.append( np.sqrt( (x1-xi)**2 + (y1-yi)**2 ).argmin() )
-        
-        if hits == []: return None
+        Px, Py = x2[i2], y2[i2]
+        Rx, Ry = np.cos(a)*L, np.sin(a)*L
+        # Segments of the First Planform as Arrays
+        Qx, Qy = x1[:-1], y1[:-1]
+        Sx, Sy = np.diff( x1 ), np.diff( y1 )
+        # Bound angle
+        a1 = np.arctan2( Sy, Sx )
+        if a0 > +np.pi/2: a1 = np.where( a1 < -np.pi/2, a1+2*np.pi, a1 )
+        if a0 < -np.pi/2: a1 = np.where( a1 > +np.pi/2, a1-2*np.pi, a1 )
+        gate = np.logical_and( a1 <= a0+np.pi/4, a1 >= a0-np.pi/4 )
+        # Parametric Ray/Segment Intersection (see misc.Intersection)
+        QPx, QPy = Qx - Px, Qy - Py
+        CRS = Rx*Sy - Ry*Sx
+        with np.errstate( divide='ignore', invalid='ignore' ):
+            t = ( QPx*Sy - Sx*QPy ) / CRS
+            u = ( QPx*Ry - Rx*QPy ) / CRS
+        isect = np.logical_and.reduce( ( gate, np.abs(CRS) > 0, np.abs(t) <= 1, np.abs(u) <= 1 ) )
+        if not np.any( isect ): return None
+        xi = Px + t[isect]*Rx
+        yi = Py + t[isect]*Ry
+        hits = np.hypot( x1[None,:]-xi[:,None], y1[None,:]-yi[:,None] ).argmin( axis=1 )
         return np.min( hits )
 
     def MigrationRates( self, data1, data2, I1, I12, B1, B2, B12 ):
         '''Compute Local Migration Rates by connected individual bends'''
 
-        [ x1, y1, s1 ] = data1['x'], data1['y'], data1['s']
-        [ x2, y2, s2 ] = data2['x'], data2['y'], data2['s']
+        [ x1, y1, s1 ] = data1.x, data1.y, data1.s
+        [ x2, y2, s2 ] = data2.x, data2.y, data2.s
         [ dx, dy, dz]  = [ NaNs( x1.size ), NaNs( x1.size ), NaNs( x1.size ) ]
 
+        # Inverted index of the Second Planform bend labels: the points of
+        # label b are order[starts[b]:starts[b+1]] (computed once instead of
+        # scanning B2==B12[il] for every bend)
+        order = np.argsort( B2, kind='stable' )
+        starts = np.searchsorted( B2[order], np.arange( B2.max()+2 ) )
+
         for i, (il,ir) in self.Iterbends( I1 ):
             # Isolate Bend
 
@@ -302,37 +346,44 @@ class AxisMigration( object ):
             if B12[il-1] == B12[il]: continue # More bends go into one
             if B12[ir+1] == B12[il]: continue # More bends go into one
 
-            mask1 = np.full( s1.size, False, dtype=bool ); mask1[il:ir]=True
-            mask2 = B2==B12[il]
-            bx1, by1, bs1, N1 = x1[mask1], y1[mask1], s1[mask1], mask1.sum() # Bend in First Planform
-            bx2, by2, bs2, N2 = x2[mask2], y2[mask2], s2[mask2], mask2.sum() # Bend in Second Planform
+            idx2 = order[ starts[B12[il]]:starts[B12[il]+1] ]
+            bx1, by1, bs1, N1 = x1[il:ir], y1[il:ir], s1[il:ir], ir-il # Bend in First Planform
+            bx2, by2, bs2, N2 = x2[idx2], y2[idx2], s2[idx2], idx2.size # Bend in Second Planform
             if N1<=1 or N2<=1: continue
-            if N2 > N1: # Remove Random Points from Second Bend in order to interpolate
-                idx = np.full( N2, True, bool )
-                idx[ np.random.choice( np.arange(2,N2-2), N2-N1, replace=False ) ] = False
-                bx2 = bx2[ idx ]
-                by2 = by2[ idx ]
-                N2 = bx2.size
-            # ReInterpolate Second Planform (Parametric Cubic Spline)
-            if N1 <= 1 or N2 <= 1: continue
-            if N1 <= 3 or N2 <= 3: kpcs=1 # If we have too few points, use linear interpolation
-            elif N1 <= 5 or N2 <= 5: kpcs=3 # If we have too few points, use linear interpolation
-            else: kpcs=5
-            bx2, by2 = InterpPCS( bx2, by2, N=N1, s=N2, k=kpcs, with_derivatives=False )
-            # Compute Migration Rates for the whole bend
-            dxb = bx2 - bx1
-            dyb = by2 - by1
-            dzb = np.sqrt( dxb**2 + dyb**2 )
-
-            # Sinuosity Control
-            sigma2 = ( bs2[-1] - bs2[0] ) / np.sqrt( (by2[-1]-by2[0])**2 + (bx2[-1]-bx2[0])**2 )
-            sigma1 = ( bs1[-1] - bs1[0] ) / np.sqrt( (by1[-1]-by1[0])**2 + (bx1[-1]-bx1[0])**2 )
+            if self.use_spline:
+                if N2 > N1: # Resample Second Bend evenly in order to interpolate
+                    t_src = np.linspace( 0, 1, N2 )
+                    t_dst = np.linspace( 0, 1, N1 )
+                    bx2 = np.interp( t_dst, t_src, bx2 )
+                    by2 = np.interp( t_dst, t_src, by2 )
+                    N2 = N1
+                # ReInterpolate Second Planform (Parametric Cubic Spline)
+                if N1 <= 1 or N2 <= 1: continue
+                if N1 <= 3 or N2 <= 3: kpcs=1 # If we have too few points, use linear interpolation
+                elif N1 <= 5 or N2 <= 5: kpcs=3 # If we have too few points, use linear interpolation
+                else: kpcs=5
+                bx2, by2 = InterpPCS( bx2, by2, N=N1, s=N2, k=kpcs, with_derivatives=False )
+            else:
+                # ReInterpolate Second Planform linearly over its normalized arc-length
+                t2 = np.concatenate( ([0], np.cumsum( np.hypot( np.diff(bx2), np.diff(by2) ) )) )
+                t2 /= t2[-1]
+                tq = np.linspace( 0, 1, N1 )
+                bx2 = np.interp( tq, t2, bx2 )
+                by2 = np.interp( tq, t2, by2 )
+            # Sinuosity Control (degenerate bends give 0/0 - NaN is fine here)
+            with np.errstate( divide='ignore', invalid='ignore' ):
+                sigma2 = ( bs2[-1] - bs2[0] ) / np.hypot( by2[-1]-by2[0], bx2[-1]-bx2[0] )
+                sigma1 = ( bs1[-1] - bs1[0] ) / np.hypot( by1[-1]-by1[0], bx1[-1]-bx1[0] )
+            # Compute Migration Rates for the whole bend (in place on the resampled buffers)
+            dxb = np.subtract( bx2, bx1, out=bx2 )
+            dyb = np.subtract( by2, by1, out=by2 )
+            dzb = np.hypot( dxb, dyb )
             # If Sinuosity has decreased significantly, assume a CutOff occurred
             if sigma1/sigma2 > 1.2: dxb, dyb, dzb = NaNs( N1 ), NaNs( N1 ), NaNs( N1 )
             # Set Migration Rate into Main Arrays
-            dx[ mask1 ] = dxb
-            dy[ mask1 ] = dyb
-            dz[ mask1 ] = dzb
+            dx[ il:ir ] = dxb
+            dy[ il:ir ] = dyb
+            dz[ il:ir ] = dzb
         return dx, dy, dz
 
     def AllMigrationRates( self ):
@@ -346,7 +397,7 @@ class AxisMigration( object ):
             B1, B2, B12 = self.BI[i], self.BI[i+1], self.B12[i]
             dxi, dyi, dzi = self.MigrationRates( d1, d2, I1, I12, B1, B2, B12 )
             self.dx.append( dxi ), self.dy.append( dyi ), self.dz.append( dzi )
-        N = ( d2['s'] ).size
+        N = d2.s.size
         self.dx.append( NaNs( N ) ), self.dy.append( NaNs( N ) ), self.dz.append( NaNs( N ) )
         return None
     